@@ -7,19 +7,132 @@ Parses timestamped track listings (e.g., from YouTube video descriptions)
 and generates a valid CUE sheet for audio players.
 """
 
-import re
 import os
 import sys
+from collections import namedtuple
 from pathlib import Path
 from datetime import datetime
 
 
+# Optional brackets allowed around a timestamp, e.g. "[0:00]" or "(0:00)"
+_OPEN_BRACKETS = '[('
+_CLOSE_BRACKETS = '])'
+
+# Lines longer than this are pasted prose, not track entries
+_MAX_LINE_LENGTH = 512
+
+# Buffer size used when streaming a CUE sheet to disk
+_WRITE_BUFFER_SIZE = 65536
+
+# Fallback REM DATE when no year is given
+_CURRENT_YEAR = datetime.now().year
+
+# Zero-padded two-digit strings for CUE track numbers and MM:SS:FF fields
+_PAD2 = tuple(f'{n:02d}' for n in range(100))
+
+# A single parsed track; times are in CUE MM:SS:FF form
+Track = namedtuple('Track', 'title minutes seconds frames')
+
+
+def _pad2(n):
+    """
+    @brief Format a non-negative integer as at least two zero-padded digits.
+
+    @param n The value to format.
+    @return The same string as `f"{n:02d}"`, via a lookup table for values below 100.
+    """
+    return _PAD2[n] if n < 100 else f'{n:02d}'
+
+
+def _unbracket(token):
+    """
+    @brief Drop one optional opening and one optional closing bracket around a token.
+
+    @param token A non-empty, whitespace-free token such as `"[0:00]"` or `"0:00)"`.
+    @return The token without its surrounding brackets.
+    """
+    start = 1 if token[0] in _OPEN_BRACKETS else 0
+    end = len(token) - 1 if token[-1] in _CLOSE_BRACKETS else len(token)
+    return token[start:end]
+
+
+def _scan_timestamp(s, i):
+    """
+    @brief Scan a `MM:SS` or `HH:MM:SS` timestamp starting at index `i`.
+
+    The leading field may have one or two digits; every following field
+    must have exactly two.
+
+    @param s The string to scan.
+    @param i Index at which the timestamp must start.
+    @return Index just past the timestamp, or -1 if no timestamp starts at `i`.
+    """
+    n = len(s)
+    j = i
+    while j < n and j - i < 2 and s[j].isdecimal():
+        j += 1
+    if j == i or j >= n or s[j] != ':':
+        return -1
+    
+    if not (j + 2 < n and s[j + 1].isdecimal() and s[j + 2].isdecimal()):
+        return -1
+    j += 3
+    
+    # Optional seconds field for HH:MM:SS
+    if j + 2 < n and s[j] == ':' and s[j + 1].isdecimal() and s[j + 2].isdecimal():
+        j += 3
+    return j
+
+
+def _parse_line(line):
+    """
+    @brief Scan one line for a timestamp and track title.
+
+    This is the allocation-light core of CueGenerator.parse_timestamp_line(),
+    used directly by the file reader.
+
+    @param line A single line of text.
+    @return A `(timestamp, title)` tuple if matched; otherwise `None`.
+    """
+    line = line.strip()
+    # Every supported timestamp contains a colon; skip prose lines cheaply
+    if len(line) > _MAX_LINE_LENGTH or ':' not in line:
+        return None
+    
+    # Remove simple list prefixes like "1. "
+    n = len(line)
+    i = 0
+    while i < n and line[i].isdecimal():
+        i += 1
+    if 0 < i < n and line[i] == '.':
+        line = line[i + 1:].lstrip()
+    
+    # Leading timestamp: "0:00 Intro", "[0:00] Intro"
+    parts = line.split(None, 1)
+    if len(parts) < 2:
+        return None
+    head, title = parts
+    timestamp = _unbracket(head)
+    if _scan_timestamp(timestamp, 0) == len(timestamp):
+        return timestamp, title
+    
+    # Trailing timestamp: "Intro 0:00", "Intro (0:00)"
+    title, tail = line.rsplit(None, 1)
+    timestamp = _unbracket(tail)
+    if _scan_timestamp(timestamp, 0) == len(timestamp):
+        return timestamp, title
+    
+    return None
+
+
 class CueGenerator:
     """
     @class CueGenerator
     @brief Handles parsing timestamps, metadata collection, and CUE file generation.
     """
 
+    __slots__ = ('album', 'artist', 'year', 'genre', 'audio_file', 'tracks')
+
     def __init__(self):
         """@brief Initialize default metadata and track storage."""
         self.album = ""
@@ -44,21 +157,35 @@ class CueGenerator:
         @raises ValueError if the timestamp is not in a recognized format.
         """
         timestamp = timestamp.strip()
-        parts = timestamp.split(':')
-
-        if len(parts) == 2:         # MM:SS
-            minutes = int(parts[0])
-            seconds = int(parts[1])
-        elif len(parts) == 3:       # HH:MM:SS
-            hours = int(parts[0])
-            minutes = int(parts[1]) + (hours * 60)
-            seconds = int(parts[2])
-        else:
+        a, sep, rest = timestamp.partition(':')
+        b, sep2, c = rest.partition(':')
+
+        if not sep or ':' in c:
             raise ValueError(f"Invalid timestamp format: {timestamp}")
         
+        if sep2:                    # HH:MM:SS
+            minutes = int(a) * 60 + int(b)
+            seconds = int(c)
+        else:                       # MM:SS
+            minutes = int(a)
+            seconds = int(b)
+        
         frames = 0  # CUE sheets use 75 frames/second; default to 0
         return minutes, seconds, frames
     
+    def _parse_validated_ts(self, timestamp):
+        """
+        @brief Fast path of parse_timestamp() for timestamps already validated by the line scanner.
+
+        @param timestamp A stripped `MM:SS` or `HH:MM:SS` string.
+        @return (minutes, seconds, frames) as integers.
+        """
+        a, _, rest = timestamp.partition(':')
+        b, sep, c = rest.partition(':')
+        if sep:
+            return int(a) * 60 + int(b), int(c), 0
+        return int(a), int(b), 0
+    
     def parse_timestamp_line(self, line):
         """
         @brief Extract timestamp and track title from a single line of text.
@@ -71,31 +198,10 @@ class CueGenerator:
         @param line A single line from the timestamps file.
         @return A dict with keys `timestamp` and `title` if matched; otherwise `None`.
         """
-        line = line.strip()
-        if not line:
+        parsed = _parse_line(line)
+        if parsed is None:
             return None
-        
-        # Remove simple list prefixes like "1. "
-        line = re.sub(r'^[\d]+\.\s*', '', line)
-        
-        patterns = [
-            r'^[\[\(]?(\d{1,2}:\d{2}(?::\d{2})?)[\]\)]?\s+(.+)$',
-            r'^(\d{1,2}:\d{2}(?::\d{2})?)\s+(.+)$',
-            r'^(.+?)\s+[\[\(]?(\d{1,2}:\d{2}(?::\d{2})?)[\]\)]?$',
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, line)
-            if match:
-                g = match.groups()
-                if ':' in g[0]:
-                    timestamp, title = g[0], g[1]
-                else:
-                    title, timestamp = g[0], g[1]
-                
-                return {'timestamp': timestamp.strip(), 'title': title.strip()}
-        
-        return None
+        return {'timestamp': parsed[0], 'title': parsed[1]}
     
     def read_timestamps_file(self, filepath):
         """
@@ -107,23 +213,22 @@ class CueGenerator:
         @raises ValueError if no valid timestamps are found.
         """
         try:
+            tracks = []
+            skipped = []
             with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+                for line_num, line in enumerate(f, 1):
+                    parsed = _parse_line(line)
+                    if parsed:
+                        timestamp, title = parsed
+                        try:
+                            mins, secs, frames = self._parse_validated_ts(timestamp)
+                            tracks.append(Track(title, mins, secs, frames))
+                        except ValueError as e:
+                            skipped.append(f"line {line_num}: {e}")
             
-            tracks = []
-            for line_num, line in enumerate(lines, 1):
-                parsed = self.parse_timestamp_line(line)
-                if parsed:
-                    try:
-                        mins, secs, frames = self.parse_timestamp(parsed['timestamp'])
-                        tracks.append({
-                            'title': parsed['title'],
-                            'minutes': mins,
-                            'seconds': secs,
-                            'frames': frames
-                        })
-                    except ValueError as e:
-                        print(f"Warning: Skipping line {line_num} - {e}")
+            # Report skipped lines in one write rather than one print per line
+            if skipped:
+                sys.stderr.write("Warnings:\n  " + "\n  ".join(skipped) + "\n")
             
             if not tracks:
                 raise ValueError("No valid timestamps found in file")
@@ -163,51 +268,86 @@ class CueGenerator:
 
         @return True if the user accepts the parsed list; False otherwise.
         """
-        print("\nPARSED TRACKS:")
-        print("="*60)
-        for i, track in enumerate(self.tracks, 1):
-            timestamp = f"{track['minutes']:02d}:{track['seconds']:02d}:{track['frames']:02d}"
-            print(f"{i:2d}. [{timestamp}] {track['title']}")
-        print("="*60)
+        # Build the whole listing and write it once; long mixes print noticeably faster
+        buf = ["\nPARSED TRACKS:\n" + "="*60 + "\n"]
+        buf.extend(
+            f"{i:2d}. [{_pad2(track.minutes)}:{_pad2(track.seconds)}:{_pad2(track.frames)}] {track.title}\n"
+            for i, track in enumerate(self.tracks, 1)
+        )
+        buf.append("="*60 + "\n")
+        sys.stdout.write(''.join(buf))
         
         response = input("\nDo these tracks look correct? (y/n): ").strip().lower()
         return response in ('y', 'yes', '')
     
+    def _iter_lines(self):
+        """
+        @brief Yield the CUE sheet text in chunks: the header, then one block per track.
+
+        Chunks already carry their line separators, so they can be joined or
+        written out as-is.
+        """
+        yield (
+            (f'REM GENRE "{self.genre}"\n' if self.genre else 'REM GENRE "Unknown"\n')
+            + f'REM DATE {self.year or _CURRENT_YEAR}\n'
+            'REM COMMENT "Generated by YouTube to CUE Converter"\n'
+            f'PERFORMER "{self.artist}"\n'
+            f'TITLE "{self.album}"\n'
+            f'FILE "{self.audio_file}" WAVE'
+        )
+        
+        # The performer line is identical for every track
+        performer_line = f'    PERFORMER "{self.artist}"'
+        for i, track in enumerate(self.tracks, 1):
+            yield (
+                f'\n  TRACK {_pad2(i)} AUDIO\n'
+                f'    TITLE "{track.title}"\n'
+                f'{performer_line}\n'
+                f'    INDEX 01 {_pad2(track.minutes)}:{_pad2(track.seconds)}:{_pad2(track.frames)}'
+            )
+    
+    def write_cue(self, f):
+        """
+        @brief Write the CUE sheet text to an open file, one track at a time.
+
+        @param f A writable text file object.
+        """
+        f.writelines(self._iter_lines())
+    
     def generate_cue_content(self):
         """
         @brief Construct the text of the CUE sheet.
 
         @return A string containing the entire CUE sheet content.
         """
-        cue_lines = []
-        
-        cue_lines.append(f'REM GENRE "{self.genre}"' if self.genre else 'REM GENRE "Unknown"')
-        cue_lines.append(f'REM DATE {self.year}' if self.year else f'REM DATE {datetime.now().year}')
-        cue_lines.append('REM COMMENT "Generated by YouTube to CUE Converter"')
-        
-        cue_lines.append(f'PERFORMER "{self.artist}"')
-        cue_lines.append(f'TITLE "{self.album}"')
-        cue_lines.append(f'FILE "{self.audio_file}" WAVE')
-        
-        for i, track in enumerate(self.tracks, 1):
-            cue_lines.append(f'  TRACK {i:02d} AUDIO')
-            cue_lines.append(f'    TITLE "{track["title"]}"')
-            cue_lines.append(f'    PERFORMER "{self.artist}"')
-            cue_lines.append(f'    INDEX 01 {track["minutes"]:02d}:{track["seconds"]:02d}:{track["frames"]:02d}')
-        
-        return '\n'.join(cue_lines)
+        return ''.join(self._iter_lines())
     
-    def save_cue_file(self, output_path):
+    def save_cue_file(self, output_path, content=None):
         """
-        @brief Write the generated CUE content to a file.
+        @brief Write the CUE sheet to a file.
+
+        Without `content`, the sheet is streamed straight to disk rather than
+        built in memory first. Either way the file is UTF-8 with `\n` line endings.
 
         @param output_path Destination file path.
+        @param content Previously generated CUE content to write; streamed if omitted.
         @return True on success, False on failure.
         """
-        content = self.generate_cue_content()
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if content is None:
+                with open(output_path, 'w', encoding='utf-8', newline='',
+                          buffering=_WRITE_BUFFER_SIZE) as f:
+                    self.write_cue(f)
+            else:
+                # Already in memory: encode once and hand it to the OS directly
+                data = memoryview(content.encode('utf-8'))
+                flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+                fd = os.open(output_path, flags, 0o666)
+                try:
+                    while data:
+                        data = data[os.write(fd, data):]
+                finally:
+                    os.close(fd)
             return True
         except Exception as e:
             print(f"Error saving file: {e}")
@@ -262,11 +402,12 @@ def main():
     
     # Save the CUE sheet
     print(f"\nGenerating CUE file: {output_file}")
-    if generator.save_cue_file(output_file):
+    content = generator.generate_cue_content()
+    if generator.save_cue_file(output_file, content):
         print(f"✓ CUE file successfully created: {output_file}")
         print("\nCUE FILE PREVIEW:")
         print("="*60)
-        print(generator.generate_cue_content())
+        print(content)
         print("="*60)
     else:
         print("✗ Failed to create CUE file")